@@ -0,0 +1,26 @@
+"""A mixin for frozen dataclasses that define their own `__slots__`.
+
+`dc.dataclass(slots=True)` is not available on Python 3.9, so slotted frozen
+dataclasses declare `__slots__` by hand. Slotted instances have no `__dict__`,
+and by default, copying and unpickling restore their state by assigning
+attributes, which frozen dataclasses forbid.
+"""
+import dataclasses as dc
+import typing as typ
+
+
+class FrozenSlotsStateMixin:
+    """Provides the state methods that `dc.dataclass(slots=True)` generates."""
+
+    __slots__ = ()
+
+    def __getstate__(self) -> typ.List[typ.Any]:
+        # Only mixed into dataclasses, which `mypy` cannot infer from here
+        fields = dc.fields(self)  # type: ignore[arg-type]
+        return [getattr(self, field.name) for field in fields]
+
+    def __setstate__(self, state: typ.List[typ.Any]) -> None:
+        fields = dc.fields(self)  # type: ignore[arg-type]
+        for field, value in zip(fields, state):
+            # Bypass the frozen `__setattr__`
+            object.__setattr__(self, field.name, value)
@@ -1,5 +1,7 @@
 """Domain models for interaction with the OpenType `name` table."""
-import pydantic as pyd
+import dataclasses as dc
+import enum
+import font_renamer._frozen_slots as fr_frozen_slots
 import font_renamer.opentype_name_constants as fr_ot_const
 import typing as typ
 
@@ -7,7 +9,7 @@ import typing as typ
 class PNameRecord(typ.Protocol):
     """Protocol for platform-specific name records."""
 
-    string: pyd.StrictStr
+    string: str
     platform_id: fr_ot_const.PlatformID
     platform_encoding_id: typ.Union[
         fr_ot_const.MacPlatformEncodingID, fr_ot_const.WindowsPlatformEncodingID
@@ -17,10 +19,80 @@ class PNameRecord(typ.Protocol):
     ]
 
 
-class MacNameRecord(pyd.BaseModel):
+EnumT = typ.TypeVar("EnumT", bound=enum.Enum)
+
+
+def _to_enum(enum_cls: typ.Type[EnumT], value: typ.Any, name: str) -> EnumT:
+    """Return `value` as a member of `enum_cls`.
+
+    Accepts members of `enum_cls` and plain `int`s that are values of its
+    members.
+
+    Raises:
+        TypeError: if `value` is neither a member nor an `int`.
+        ValueError: if `value` is an `int` that is not a member's value.
+    """
+    if isinstance(value, enum_cls):
+        return value
+    # Booleans are `int`s too, but are never meant as IDs
+    if type(value) is not int:
+        raise TypeError(
+            f"{name} must be a `{enum_cls.__name__}` or an `int`. "
+            f"Got: {value}"
+        )
+    return enum_cls(value)
+
+
+@dc.dataclass(frozen=True)
+class MacNameRecord(fr_frozen_slots.FrozenSlotsStateMixin):
     """Mac-specific name record."""
 
-    string: pyd.StrictStr
+    # `dc.dataclass(slots=True)` is not available on Python 3.9
+    __slots__ = ("string", "platform_id", "platform_encoding_id", "language_id")
+
+    string: str
     platform_id: typ.Literal[fr_ot_const.PlatformID.MAC]
     platform_encoding_id: fr_ot_const.MacPlatformEncodingID
     language_id: fr_ot_const.MacLanguageID
+
+    def __post_init__(self) -> None:
+        # Name records are created in bulk, so instead of validating them with
+        # a full-blown model library, only do the cheap checks that we need.
+        # fontTools hands out IDs as plain `int`s, so convert them to enums.
+        if type(self.string) is not str:
+            raise TypeError(f"Name string must be a `str`. Got: {self.string}")
+        platform_id = _to_enum(
+            fr_ot_const.PlatformID, self.platform_id, "Platform ID"
+        )
+        if platform_id is not fr_ot_const.PlatformID.MAC:
+            raise ValueError(
+                f"Platform ID must be {fr_ot_const.PlatformID.MAC}. "
+                f"Got: {self.platform_id}"
+            )
+        # The instance is frozen, so bypass the frozen `__setattr__`
+        object.__setattr__(self, "platform_id", platform_id)
+        object.__setattr__(
+            self,
+            "platform_encoding_id",
+            _to_enum(
+                fr_ot_const.MacPlatformEncodingID,
+                self.platform_encoding_id,
+                "Platform encoding ID",
+            ),
+        )
+        object.__setattr__(
+            self,
+            "language_id",
+            _to_enum(
+                fr_ot_const.MacLanguageID, self.language_id, "Language ID"
+            ),
+        )
+
+    def as_dict(self) -> typ.Dict[str, typ.Any]:
+        """Return the name record as a dictionary."""
+        return {
+            "string": self.string,
+            "platform_id": self.platform_id,
+            "platform_encoding_id": self.platform_encoding_id,
+            "language_id": self.language_id,
+        }
@@ -119,6 +119,20 @@ class WindowsPlatformEncodingID(PlatformEncodingID, enum.Enum):
     UNICODE_FULL_REPERTOIRE = 10
 
 
+def _lowercase_language_codes(
+    language_codes: typ.Mapping[str, LanguageID]
+) -> tuple[tuple[str, LanguageID], ...]:
+    """Return `(language_code, language_id)` pairs with lowercase codes.
+
+    The functional `Enum` API accepts an iterable of name-value pairs, so
+    build them in one pass instead of an intermediate dictionary.
+    """
+    return tuple(
+        (lang_code.lower(), lang_id)
+        for lang_code, lang_id in language_codes.items()
+    )
+
+
 __MAC_LANGUAGE_ID_DOC: str = (
     """`languageID` values defined for use with the Mac platform.
 
@@ -127,12 +141,9 @@ __MAC_LANGUAGE_ID_DOC: str = (
 )
 MacLanguageID: typ.Final[type[enum.Enum]] = enum.Enum(
     "MacLanguageID",
-    {
-        # Ignore Enum convention of naming member values in all caps in favor
-        # of BCP-47 codes, which are most commonly used in lowercase
-        lang_code.lower(): lang_id
-        for lang_code, lang_id in ft_table_name._MAC_LANGUAGE_CODES.items()
-    },
+    # Ignore Enum convention of naming member values in all caps in favor of
+    # BCP-47 codes, which are most commonly used in lowercase
+    _lowercase_language_codes(ft_table_name._MAC_LANGUAGE_CODES),
     type=int,
 )
 MacLanguageID.__doc__ = __MAC_LANGUAGE_ID_DOC
@@ -145,10 +156,7 @@ __WINDOWS_LANGUAGE_ID_DOC: str = (
 )
 WindowsLanguageID: typ.Final[type[enum.Enum]] = enum.Enum(
     "WindowsLanguageID",
-    {
-        lang_code.lower(): lang_id
-        for lang_code, lang_id in ft_table_name._WINDOWS_LANGUAGE_CODES.items()
-    },
+    _lowercase_language_codes(ft_table_name._WINDOWS_LANGUAGE_CODES),
     # fontTools expects language IDs to be `int`, so support them for possible
     # interoperability in comparisons and serialization
     type=int,
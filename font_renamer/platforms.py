@@ -7,10 +7,10 @@ to prevent modification.
 """
 import collections.abc as col_abc
 import dataclasses as dc
+import types
 import typing as typ
 
 import fontTools.ttLib.tables._n_a_m_e as ft_table_name
-import immutables as im
 
 import font_renamer.opentype_name_constants as fr_const
 
@@ -22,20 +22,20 @@ class UnsupportedLanguageCodeError(KeyError):
 # Maps IETF BCP-47 codes (e. g. "en", "ar") to platform-specific `language_id`s
 # These maps need to be immutable to be truly constant, so wrap dicts provided
 # by FontTools in `MappingProxyType` from here on out
-_MAC_LANGUAGE_IDS: typ.Mapping[str, fr_const.LanguageID] = im.Map(
-    ft_table_name._MAC_LANGUAGE_CODES
-)
+_MAC_LANGUAGE_IDS: typ.Mapping[
+    str, fr_const.LanguageID
+] = types.MappingProxyType(dict(ft_table_name._MAC_LANGUAGE_CODES))
 
 
-_WINDOWS_LANGUAGE_IDS: typ.Mapping[str, fr_const.LanguageID] = im.Map(
-    ft_table_name._WINDOWS_LANGUAGE_CODES
-)
+_WINDOWS_LANGUAGE_IDS: typ.Mapping[
+    str, fr_const.LanguageID
+] = types.MappingProxyType(dict(ft_table_name._WINDOWS_LANGUAGE_CODES))
 
 
 # Maps language IDs to platform encoding IDs
 _MAC_PLATFORM_ENCODING_IDS: typ.Mapping[
     fr_const.LanguageID, fr_const.MacPlatformEncodingID
-] = im.Map(
+] = types.MappingProxyType(
     {
         lang: fr_const.MacPlatformEncodingID(encoding)
         for lang, encoding in ft_table_name._MAC_LANGUAGE_TO_SCRIPT.items()
@@ -45,7 +45,7 @@ _MAC_PLATFORM_ENCODING_IDS: typ.Mapping[
 
 _WINDOWS_PLATFORM_ENCODING_IDS: typ.Mapping[
     fr_const.LanguageID, fr_const.WindowsPlatformEncodingID
-] = im.Map(
+] = types.MappingProxyType(
     {
         # Every language should be encoded as Unicode, since this is the most
         # widely supported option
@@ -55,13 +55,30 @@ _WINDOWS_PLATFORM_ENCODING_IDS: typ.Mapping[
 )
 
 
+class LanguageInfo(typ.NamedTuple):
+    """A data structure describing the platform-specific language info.
+
+    Since language information is platform-specific, and the same language can
+    map to different `language_id`s and `language_encoding_id`s on different
+    platforms, we have to store a low-level platform-specific value for each
+    platform.
+
+    A named tuple rather than a frozen dataclass, since it is just as immutable,
+    but cheaper to create and smaller in memory.
+    """
+
+    platform_id: fr_const.PlatformID
+    language_id: int
+    platform_encoding_id: int
+
+
 @dc.dataclass(frozen=True)
 class Platform:
     """A platform supported by the OpenType specification."""
 
     name: str
     platform_id: fr_const.PlatformID
-    valid_platform_encoding_ids: col_abc.Set[fr_const.PlatformID]
+    valid_platform_encoding_ids: col_abc.Set[fr_const.PlatformEncodingID]
     valid_language_ids: col_abc.Set[fr_const.LanguageID]
 
 
@@ -73,10 +90,62 @@ class LanguageMappedPlatform(Platform):
     BCP-47 language code.
     """
 
-    language_ids: typ.Mapping[str, fr_const.LanguageID]
+    # Read-only mappings are not hashable, so hash platforms by their other
+    # fields. Equal platforms still have equal hashes.
+    language_ids: typ.Mapping[str, fr_const.LanguageID] = dc.field(hash=False)
     platform_encoding_ids: typ.Mapping[
         fr_const.LanguageID, fr_const.PlatformID
-    ]
+    ] = dc.field(hash=False)
+    # Maps BCP-47 codes to complete `LanguageInfo`s. Derived from the mappings
+    # above once per instance, so that looking up language info for a code
+    # takes a single dict lookup instead of resolving every ID separately
+    _language_infos: typ.Mapping[str, LanguageInfo] = dc.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Keep the mappings read-only, even if plain dicts were provided
+        for field_name in ("language_ids", "platform_encoding_ids"):
+            mapping = getattr(self, field_name)
+            if not isinstance(mapping, types.MappingProxyType):
+                object.__setattr__(
+                    self, field_name, types.MappingProxyType(dict(mapping))
+                )
+
+        language_infos = {
+            language_code: LanguageInfo(
+                self.platform_id,
+                language_id,
+                self.platform_encoding_ids[language_id],
+            )
+            for language_code, language_id in self.language_ids.items()
+            # Languages without an encoding do not have complete info
+            if language_id in self.platform_encoding_ids
+        }
+        # The instance is frozen, so bypass the frozen `__setattr__`
+        object.__setattr__(
+            self, "_language_infos", types.MappingProxyType(language_infos)
+        )
+
+    def __reduce__(
+        self,
+    ) -> typ.Tuple[typ.Type["LanguageMappedPlatform"], typ.Tuple]:
+        # `MappingProxyType` cannot be pickled, so recreate the platform from
+        # plain copies of its mappings. `__post_init__` makes them read-only
+        # again.
+        return (
+            type(self),
+            tuple(
+                dict(value)
+                if isinstance(value, types.MappingProxyType)
+                else value
+                for value in (
+                    getattr(self, field.name)
+                    for field in dc.fields(self)
+                    if field.init
+                )
+            ),
+        )
 
     def get_language_id(self, language_code: str) -> fr_const.LanguageID:
         """Return OpenType `language_id` for a given BCP-47 code.
@@ -84,61 +153,60 @@ class LanguageMappedPlatform(Platform):
         Raises an `UnsupportedLanguageCodeError` when a language ID cannot be
         found for a given language code.
         """
-        try:
-            language_id = self.language_ids[language_code]
-        except KeyError:
+        language_id = self.language_ids.get(language_code)
+        if language_id is None:
             raise UnsupportedLanguageCodeError(
-                f'Unable to find a language ID for "{language_code}". '
-                f"Supported languages: {self.language_ids}"
+                f'Unable to find a language ID for "{language_code}".'
             )
         return language_id
 
     def get_platform_encoding_id(
         self, language_code: str
-    ) -> fr_const.PlatformID:
+    ) -> fr_const.PlatformEncodingID:
         """Return OpenType `platform_encoding_id` for a given BCP-47 code.
 
         Raises an `UnsupportedLanguageCodeError` when a platform encoding ID
         cannot be found for a given language code.
         """
-        language_id = self.get_language_id(language_code)
-        try:
-            platform_encoding_id = self.platform_encoding_ids[language_id]
-        except KeyError:
+        return self.get_language_info(language_code).platform_encoding_id
+
+    def get_language_info(self, language_code: str) -> LanguageInfo:
+        """Return `LanguageInfo` for a given BCP-47 code.
+
+        Raises an `UnsupportedLanguageCodeError` when either a language ID or
+        a platform encoding ID cannot be found for a given language code.
+        """
+        language_info = self._language_infos.get(language_code)
+        if language_info is None:
+            # Only complete infos are precomputed, so find out which of the IDs
+            # is missing to report it. Raises if the language ID is missing.
+            self.get_language_id(language_code)
             raise UnsupportedLanguageCodeError(
                 f"Unable to find a platform encoding ID "
-                f'for "{language_code}". '
-                f"Supported languages: {self.platform_encoding_ids}"
+                f'for "{language_code}".'
             )
-        return platform_encoding_id
+        return language_info
 
 
-@dc.dataclass(frozen=True)
-class LanguageInfo:
-    """A data structure describing the platform-specific language info.
+def get_language_info(
+    platform: LanguageMappedPlatform, language_code: str
+) -> LanguageInfo:
+    """Return `LanguageInfo` for a given platform and language code.
 
-    Since language information is platform-specific, and the same language can
-    map to different `language_id`s and `language_encoding_id`s on different
-    platforms, we have to store a low-level platform-specific value for each
-    platform.
+    Raises an `UnsupportedLanguageCodeError` when language info cannot be
+    found for a given language code.
     """
-
-    platform_id: fr_const.PlatformID
-    language_id: int
-    platform_encoding_id: int
-
-
-def get_language_info(platform, language_code: str) -> LanguageInfo:
-    """Return `LanguageInfo` for a given platform and language code."""
-    language_id = platform.get_language_id(language_code)
-    platform_encoding_id = platform.get_platform_encoding_id(language_code)
-    return LanguageInfo(platform.platform_id, language_id, platform_encoding_id)
+    return platform.get_language_info(language_code)
 
 
 WINDOWS_PLATFORM: LanguageMappedPlatform = LanguageMappedPlatform(
     name="windows",
     platform_id=fr_const.PlatformID.WINDOWS,
-    valid_platform_encoding_ids=frozenset(fr_const.WindowsPlatformEncodingID),
+    # Store plain `int`s, since the IDs we check against come from fontTools as
+    # `int`s too
+    valid_platform_encoding_ids=frozenset(
+        encoding.value for encoding in fr_const.WindowsPlatformEncodingID
+    ),
     valid_language_ids=frozenset(_WINDOWS_LANGUAGE_IDS.values()),
     language_ids=_WINDOWS_LANGUAGE_IDS,
     platform_encoding_ids=_WINDOWS_PLATFORM_ENCODING_IDS,
@@ -146,11 +214,23 @@ WINDOWS_PLATFORM: LanguageMappedPlatform = LanguageMappedPlatform(
 MAC_PLATFORM: LanguageMappedPlatform = LanguageMappedPlatform(
     name="mac",
     platform_id=fr_const.PlatformID.MAC,
-    valid_platform_encoding_ids=frozenset(fr_const.MacPlatformEncodingID),
+    # Plain `int`s as well, same as for Windows
+    valid_platform_encoding_ids=frozenset(
+        encoding.value for encoding in fr_const.MacPlatformEncodingID
+    ),
     valid_language_ids=frozenset(_MAC_LANGUAGE_IDS.values()),
     language_ids=_MAC_LANGUAGE_IDS,
     platform_encoding_ids=_MAC_PLATFORM_ENCODING_IDS,
 )
 
 
-PLATFORMS: typ.Tuple = (WINDOWS_PLATFORM, MAC_PLATFORM)
+# Maps platform IDs to supported platforms, so that consumers can look a
+# platform up by ID without building their own index
+PLATFORMS: typ.Mapping[
+    fr_const.PlatformID, LanguageMappedPlatform
+] = types.MappingProxyType(
+    {
+        WINDOWS_PLATFORM.platform_id: WINDOWS_PLATFORM,
+        MAC_PLATFORM.platform_id: MAC_PLATFORM,
+    }
+)
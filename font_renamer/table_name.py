@@ -11,6 +11,7 @@ choices, we adapt some of the behavior:
 import abc
 import dataclasses as dc
 import typing as typ
+import font_renamer._frozen_slots as fr_frozen_slots
 import font_renamer.opentype_name_constants as fr_const
 
 import fontTools.ttLib.tables._n_a_m_e as ft_name_table
@@ -21,6 +22,10 @@ import pydantic as pyd
 class PNameRecord(typ.Protocol):
     """A protocol for name record instances."""
 
+    # Allow implementors to define `__slots__` without getting a `__dict__`
+    # from the protocol
+    __slots__ = ()
+
     string: str
     name_id: int
     platform_id: int
@@ -43,8 +48,19 @@ class PNameRecord(typ.Protocol):
 
 
 @dc.dataclass(frozen=True)
-class NameRecord(PNameRecord):
+class NameRecord(fr_frozen_slots.FrozenSlotsStateMixin, PNameRecord):
     """A standard name record implementation."""
+
+    # Name records are created for every record in a font, so keep instances
+    # small. `dc.dataclass(slots=True)` is not available on Python 3.9
+    __slots__ = (
+        "string",
+        "name_id",
+        "platform_id",
+        "platform_encoding_id",
+        "language_id",
+    )
+
     string: str
     name_id: int
     platform_id: int
@@ -53,7 +69,13 @@ class NameRecord(PNameRecord):
 
     def as_dict(self) -> typ.Dict[str, typ.Union[int, str]]:
         """Return the name record as a dictionary."""
-        return dict(self.__dict__)
+        return {
+            "string": self.string,
+            "name_id": self.name_id,
+            "platform_id": self.platform_id,
+            "platform_encoding_id": self.platform_encoding_id,
+            "language_id": self.language_id,
+        }
 
     @classmethod
     def from_ft_name_record(
@@ -150,12 +172,17 @@ class TTLibToNameTableAdapter(PNameTable):
         # try use it in other methods. This raises an `AttributeError`
         # unexpectedly. Since we expect the attribute to exist, and not raise
         # exceptions in random places, when adapting a `table__n_a_m_e`
-        # instance, if the `names` attribute does not exist, initialize it to
-        # an empty list to minimize unexpected exceptions and stabilize the
-        # interface.
-        if not hasattr(table, "names"):
+        # instance, if the `names` attribute does not exist or is unset,
+        # initialize it to an empty list to minimize unexpected exceptions and
+        # stabilize the interface.
+        if getattr(table, "names", None) is None:
             self._table.names = []
 
+        # Name records are usually queried and set in bulk, so bind the table
+        # methods once instead of looking them up on every call
+        self._get_name = table.getName
+        self._set_name = table.setName
+
     def get_name_record(
         self,
         name_id: int,
@@ -163,7 +190,7 @@ class TTLibToNameTableAdapter(PNameTable):
         platform_encoding_id: int,
         language_id: int,
     ) -> ft_name_table.NameRecord:
-        name_record = self._table.getName(
+        name_record = self._get_name(
             name_id, platform_id, platform_encoding_id, language_id
         )
         # fontTools returns `None` if a name string cannot be found in a
@@ -204,7 +231,7 @@ class TTLibToNameTableAdapter(PNameTable):
         platform_encoding_id: int,
         language_id: int,
     ) -> None:
-        self._table.setName(
+        self._set_name(
             string=string,
             nameID=name_id,
             platformID=platform_id,
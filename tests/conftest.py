@@ -12,16 +12,36 @@ This behavior is undesired, therefore, we load the module with custom
 Hypothesis strategies into the global fixture scope to ensure that pytest
 loads the module at least once and registers the strategies.
 """
+import os
 import typing as typ
 
 import fontTools.ttLib.tables._n_a_m_e as ft_table_name
 from fontTools.ttLib.tables._n_a_m_e import table__n_a_m_e as NameTable
+import hypothesis as h
 import pytest
 
 from . import types as tt
 from . import hypothesis_strategies  # Ensure custom strategies are loaded
 
 
+# Some strategies are inherently slow, since they filter drawn values. Timing
+# them out or re-running them for health checks only makes the suite slower, so
+# disable the deadline and slowness checks. Use a smaller number of examples
+# for local runs by default, and select the "ci" profile for thorough runs via
+# the `HYPOTHESIS_PROFILE` environment variable.
+h.settings.register_profile(
+    "fast",
+    deadline=None,
+    max_examples=25,
+    suppress_health_check=[
+        h.HealthCheck.too_slow,
+        h.HealthCheck.filter_too_much,
+    ],
+)
+h.settings.register_profile("ci", deadline=None, max_examples=50)
+h.settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "fast"))
+
+
 # name string, nameID, platformID, encodingID, languageID
 NameRecordTuple = typ.Tuple[str, int, int, int, int]
 
@@ -46,26 +66,31 @@ NAME_IDS = {
 }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def name_table_empty() -> typ.Generator[NameTable, None, None]:
-    """Provides an empty `name` table."""
+    """Provides an empty `name` table.
+
+    The table is shared among tests, so tests should not modify it. Use
+    `make_name_table` to get a fresh table instead.
+    """
     yield NameTable()
 
 
 @pytest.fixture(scope="session")
-def ft_name_record_from_name_record_tuple() -> typ.Generator[
-    typ.Callable[[tt.NameRecordTupleMaybe], ft_table_name.NameRecord],
-    None,
-    None,
+def ft_name_record_from_name_record_tuple() -> typ.Callable[
+    [tt.NameRecordTupleMaybe], ft_table_name.NameRecord
 ]:
     """Factory function for creating fontTools `NameRecord`s from our own
     `NameRecordTuple`s.
     """
+    # The factory is called for every generated example, so look the function
+    # up only once
+    make_name = ft_table_name.makeName
 
     def _ft_name_record_from_name_record_tuple(
         name_record_tuple: tt.NameRecordTupleMaybe,
     ) -> ft_table_name.NameRecord:
-        return ft_table_name.makeName(
+        return make_name(
             name_record_tuple.string,
             name_record_tuple.name_id,
             name_record_tuple.platform_id,
@@ -73,19 +98,22 @@ def ft_name_record_from_name_record_tuple() -> typ.Generator[
             name_record_tuple.language_id,
         )
 
-    yield _ft_name_record_from_name_record_tuple
+    return _ft_name_record_from_name_record_tuple
 
 
-@pytest.fixture
-def make_name_table(
-    name_table_empty: NameTable,
-) -> typ.Callable[[typ.Iterable[NameRecordTuple]], NameTable]:
+@pytest.fixture(scope="session")
+def make_name_table() -> typ.Callable[
+    [typ.Iterable[NameRecordTuple]], NameTable
+]:
     """Factory as fixture that provides a function to create a non-empty `name`
     table that contains provided name records.
+
+    Every call creates a new table, so the factory can be shared among tests
+    without leaking records from one table into another.
     """
-    name_table = name_table_empty
 
     def _make_name_table(entries: typ.Iterable[NameRecordTuple]) -> NameTable:
+        name_table = NameTable()
         for e in entries:
             name_table.setName(*e)
 
@@ -95,6 +123,8 @@ def make_name_table(
 
 
 @pytest.fixture(
+    # The records are plain immutable data, so they can be shared among tests
+    scope="session",
     params=[
         [
             # Windows font naming nameID range
@@ -116,7 +146,7 @@ def make_name_table(
             ),
             ("BoldMax", NAME_IDS["mac"]["subfamily"], *PLATFORM_IDS["mac"]),
         ],
-    ]
+    ],
 )
 def raw_name_records(
     request,
@@ -130,11 +160,12 @@ def raw_name_records(
 
 
 @pytest.fixture(
+    scope="session",
     params=[
         "CC Wild Words",
         "CC Victory Speech",
         "Helvetica",
-    ]
+    ],
 )
 def font_family_name(request) -> typ.Generator[str, None, None]:
     yield request.param
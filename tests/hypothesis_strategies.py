@@ -1,7 +1,9 @@
 """Custom Hypothesis strategies for generating test data."""
 import collections.abc as col_abc
-import typing as typ
+import enum
+import functools as ft
 import logging
+import typing as typ
 
 import hypothesis.strategies as h_strats
 
@@ -12,9 +14,44 @@ from . import types as tt
 from . import utils
 
 
+logger = logging.getLogger(__name__)
+
+
 T = typ.TypeVar("T")
 
 
+# Sort supported platforms once, since they are used to build strategies and
+# test parameters. A stable order keeps examples reproducible.
+PLATFORMS_BY_NAME: tuple[fr_platforms.LanguageMappedPlatform, ...] = tuple(
+    sorted(fr_platforms.PLATFORMS.values(), key=lambda x: x.name)
+)
+
+
+# Every supported platform paired with every language code it supports. The
+# pairs are a small finite set, so sampling from them directly is much cheaper
+# than drawing a platform and then a language code dependent on it.
+_PLATFORM_LANGUAGE_CODE_PAIRS: tuple[
+    tuple[fr_platforms.LanguageMappedPlatform, str], ...
+] = tuple(
+    (platform, language_code)
+    for platform in PLATFORMS_BY_NAME
+    for language_code in sorted(platform.language_ids)
+)
+
+
+supported_platform_language_codes: h_strats.SearchStrategy[
+    tuple[fr_platforms.LanguageMappedPlatform, str]
+] = h_strats.sampled_from(_PLATFORM_LANGUAGE_CODE_PAIRS)
+
+
+# Language codes that platforms do not support. Supported codes are short
+# BCP-47 codes, so prefix drawn text with a marker that no code starts with,
+# instead of rejecting drawn codes that happen to be supported.
+unsupported_language_codes: h_strats.SearchStrategy[str] = h_strats.text(
+    min_size=1
+).map(lambda x: "__unsupported__" + x)
+
+
 @h_strats.composite
 def same_type_but_not(
     draw,
@@ -30,29 +67,64 @@ def same_type_but_not(
             f"Excluded values cannot be empty. Got: {excluded_values}"
         )
 
+    # The filter runs on every draw, so check membership in a set instead of
+    # scanning a sequence. Unhashable values, such as lists, can only be
+    # scanned, though.
+    excluded: col_abc.Container[T]
+    try:
+        excluded = frozenset(excluded_values)
+    except TypeError:
+        excluded = tuple(excluded_values)
+
+    # Enums have a small, bounded set of members, so filtering drawn members
+    # can reject most of them. Sample from the remaining members instead.
+    if isinstance(example_value, enum.Enum):
+        return draw(
+            h_strats.sampled_from(
+                [m for m in type(example_value) if m not in excluded]
+            )
+        )
+
     matching_type_strategy = h_strats.from_type(type(example_value))
     strategy_except_values = matching_type_strategy.filter(
-        lambda x: x not in excluded_values
+        lambda x: x not in excluded
     )
     return draw(strategy_except_values)
 
 
+# A pool of values of common types to draw "anything" from. Drawing an
+# arbitrary type first, and then an instance of it, makes Hypothesis search its
+# type registry on every draw and reject most of the drawn values, which is
+# very slow.
+plain_values: h_strats.SearchStrategy = h_strats.one_of(
+    h_strats.none(),
+    h_strats.booleans(),
+    h_strats.integers(),
+    h_strats.floats(allow_nan=False),
+    h_strats.text(),
+    h_strats.binary(),
+    h_strats.lists(h_strats.integers()),
+)
+
+
 def everything_except_value(*excluded_values) -> h_strats.SearchStrategy:
-    """Return a strategy that returns valid values of every type except values
-    in `excluded_values`.
+    """Return a strategy that returns values from `plain_values`, except
+    values in `excluded_values`.
+
+    The pool covers `None`, booleans, integers, floats, text, bytes and lists of
+    integers.
     """
-    return (
-        h_strats.from_type(type)
-        .flatmap(h_strats.from_type)
-        .filter(lambda x: x not in excluded_values)
-    )
+    return plain_values.filter(lambda x: x not in excluded_values)
 
 
 def everything_except(
     *excluded_types: type, exclude_superclasses=False
 ) -> h_strats.SearchStrategy:
-    """Return a strategy that returns valid values of every type except those
-    in `excluded_types`.
+    """Return a strategy that returns values from `plain_values`,
+    except instances of `excluded_types`.
+
+    The pool covers `None`, booleans, integers, floats, text, bytes and lists of
+    integers, so values of other types are never drawn.
 
     Args:
         *excluded_types: types, instances of which will be excluded from
@@ -61,20 +133,47 @@ def everything_except(
         types?
     """
 
-    def tmp(x):
-        print(
-            f'Texting object "{x}" of type {type(x)} against {excluded_types}'
-        )
-        return (
+    def _is_not_excluded(x: typ.Any) -> bool:
+        if any(utils.isinstance_(x, t) for t in excluded_types):
+            return False
+        return not (
             exclude_superclasses
-            and not utils.issubclass_(type(x), excluded_types)
-        ) or not utils.isinstance(x, excluded_types)
+            and any(
+                isinstance(t, type) and issubclass(t, type(x))
+                for t in excluded_types
+            )
+        )
 
-    return (
-        h_strats.from_type(type).flatmap(h_strats.from_type)
-        # .filter(lambda x: not _isinstance(x, excluded_types))
-        .filter(tmp)
-    )
+    return plain_values.filter(_is_not_excluded)
+
+
+# Composite strategies below are called on every draw, while looking
+# strategies up in the type registry gives the same results for a given class.
+# Therefore, cache them per class.
+@ft.lru_cache(maxsize=None)
+def _valid_init_arg_strategies(
+    cls: type,
+) -> col_abc.Mapping[str, h_strats.SearchStrategy]:
+    """Return strategies for valid init arguments of `cls` by argument name."""
+    return {
+        arg_name: h_strats.from_type(arg_type)
+        for arg_name, arg_type in utils.get_type_hints_or_raise(cls).items()
+    }
+
+
+@ft.lru_cache(maxsize=None)
+def _invalid_init_arg_strategies(
+    cls: type, exclude_superclasses: bool
+) -> col_abc.Mapping[str, h_strats.SearchStrategy]:
+    """Return strategies for invalid init arguments of `cls` by argument
+    name.
+    """
+    return {
+        arg_name: everything_except(
+            arg_type, exclude_superclasses=exclude_superclasses
+        )
+        for arg_name, arg_type in utils.get_type_hints_or_raise(cls).items()
+    }
 
 
 @h_strats.composite
@@ -83,8 +182,8 @@ def valid_init_args_for(draw, cls: type) -> col_abc.Mapping[str, typ.Any]:
     of `cls`.
     """
     return {
-        arg_name: draw(h_strats.from_type(arg_type))
-        for arg_name, arg_type in _get_type_hints_or_raise(cls).items()
+        arg_name: draw(arg_strategy)
+        for arg_name, arg_strategy in _valid_init_arg_strategies(cls).items()
     }
 
 
@@ -97,9 +196,13 @@ def invalid_init_args_for(
 
     Class `cls` must be type-annotated.
     """
-    type_hints = _get_type_hints_or_raise(cls)
+    type_hints = utils.get_type_hints_or_raise(cls)
     if not type_hints:
         raise ValueError(f"Class {cls} is not type-annotated.")
+    valid_arg_strategies = _valid_init_arg_strategies(cls)
+    invalid_arg_strategies = _invalid_init_arg_strategies(
+        cls, exclude_superclasses
+    )
 
     # At least one generated argument has to be invalid
     target_invalid_args_count = draw(
@@ -109,18 +212,17 @@ def invalid_init_args_for(
     final_args = {}
     added_invalid_args_count = 0
     invalid_args = {}
-    for arg_name, arg_type in type_hints.items():
+    for arg_name in type_hints:
         if added_invalid_args_count < target_invalid_args_count:
-            val = draw(
-                everything_except(
-                    arg_type, exclude_superclasses=exclude_superclasses
-                )
-            )
+            val = draw(invalid_arg_strategies[arg_name])
             added_invalid_args_count += 1
             invalid_args[arg_name] = val
         else:
-            val = draw(h_strats.from_type(arg_type))
+            val = draw(valid_arg_strategies[arg_name])
         final_args[arg_name] = val
 
-    logging.warn(f"Invalid args: {invalid_args}")
+    # Strategies are drawn from hundreds of times per test, so avoid
+    # formatting the message unless it is going to be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Invalid args: %s", invalid_args)
     return final_args
@@ -11,6 +11,7 @@ import font_renamer.models as fr_models
 import font_renamer.opentype_name_constants as fr_ot_const
 
 from . import hypothesis_strategies as h_strats_custom
+from . import utils
 
 
 class TestNameRecord:
@@ -45,6 +46,51 @@ class TestMacNameRecord:
         )
         assert isinstance(nr.language_id, fr_ot_const.MacLanguageID)
 
+    @h.given(
+        init_args=h_strats_custom.valid_init_args_for(fr_models.MacNameRecord)
+    )
+    def test_name_record_from_plain_ints_equals_record_from_enums(
+        self,
+        init_args: col_abc.Mapping[str, typ.Any],
+    ) -> None:
+        """Test if IDs passed as plain `int`s, as fontTools provides them, are
+        converted to enum members.
+        """
+        nr = fr_models.MacNameRecord(**init_args)
+        nr_from_ints = fr_models.MacNameRecord(
+            string=nr.string,
+            platform_id=int(nr.platform_id),
+            platform_encoding_id=int(nr.platform_encoding_id),
+            language_id=int(nr.language_id),
+        )
+        assert nr_from_ints == nr
+        assert nr_from_ints.as_dict() == nr.as_dict()
+        assert nr_from_ints.language_id is nr.language_id
+
+    @pytest.mark.parametrize(
+        "field_name,value",
+        [
+            ("platform_id", fr_ot_const.PlatformID.WINDOWS.value),
+            ("platform_encoding_id", True),
+            ("language_id", "0"),
+        ],
+    )
+    def test_name_record_with_invalid_raw_id_raises(
+        self, field_name: str, value: typ.Any
+    ) -> None:
+        """Test if IDs that are neither valid `int`s nor enum members
+        raise.
+        """
+        init_args = {
+            "string": "Family",
+            "platform_id": 1,
+            "platform_encoding_id": 0,
+            "language_id": 0,
+            field_name: value,
+        }
+        with pytest.raises((TypeError, ValueError)):
+            fr_models.MacNameRecord(**init_args)
+
     @h.given(
         invalid_init_args=h_strats_custom.invalid_init_args_for(
             fr_models.MacNameRecord,
@@ -63,3 +109,18 @@ class TestMacNameRecord:
         """
         with pytest.raises(Exception):
             fr_models.MacNameRecord(**invalid_init_args)
+
+    @h.given(
+        init_args=h_strats_custom.valid_init_args_for(fr_models.MacNameRecord)
+    )
+    @utils.parametrize_round_trips
+    def test_round_trip_returns_equal_name_record(
+        self,
+        round_trip: typ.Callable[
+            [fr_models.MacNameRecord], fr_models.MacNameRecord
+        ],
+        init_args: col_abc.Mapping[str, typ.Any],
+    ) -> None:
+        """Test if copying or pickling a name record returns an equal record."""
+        nr = fr_models.MacNameRecord(**init_args)
+        assert round_trip(nr) == nr
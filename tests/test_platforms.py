@@ -1,12 +1,33 @@
 """Tests for facilities defined to be used with constants."""
 import dataclasses as dc
+import functools as ft
+import typing as typ
 
 import hypothesis as h
 import hypothesis.strategies as h_strats
 import pytest
 
+import font_renamer.opentype_name_constants as fr_const
 import font_renamer.platforms as fr_platforms
 
+from . import hypothesis_strategies as h_strats_custom
+from . import utils
+
+
+# Any plausible platform, not only supported ones. Build the strategy once and
+# share it among tests instead of resolving it for every `given()`.
+_PLATFORM_STRAT = h_strats.from_type(fr_platforms.LanguageMappedPlatform)
+
+
+# Supported platforms paired with names of their attributes
+_PLATFORM_ATTR_PAIRS: tuple[
+    tuple[fr_platforms.LanguageMappedPlatform, str], ...
+] = tuple(
+    (platform, attribute_name)
+    for platform in h_strats_custom.PLATFORMS_BY_NAME
+    for attribute_name in sorted(vars(platform).keys())
+)
+
 
 class TestLanguageMappedPlatform:
     """Tests instances of platforms with language mappings attached."""
@@ -14,40 +35,51 @@ class TestLanguageMappedPlatform:
     @h.given(
         # We need to check valid platform instances with language codes that
         # are supported by a given instance. Therefore, to minimize the
-        # search space of supported language codes, it makes sense to use the
-        # instance itself as a source of supported language codes.
-        #
-        # To do this, we need to share the platform instance drawn from the
-        # platform generation strategy with the language code generation
-        # strategy, and draw a language code from the shared platform instance.
-        platform=h_strats.shared(
-            h_strats.from_type(fr_platforms.LanguageMappedPlatform),
-            # Ensure that examples from the strategy are shared by using an
-            # explicit key
-            key="shared_platform",
-        ),
-        lang_code=h_strats.shared(
-            h_strats.from_type(fr_platforms.LanguageMappedPlatform),
-            key="shared_platform",
-        ).flatmap(
-            lambda x: h_strats.sampled_from(sorted(x.language_ids.keys()))
+        # search space of supported language codes, draw platforms paired with
+        # the language codes they support.
+        platform_and_lang_code=(
+            h_strats_custom.supported_platform_language_codes
         ),
     )
-    def test_get_language_id_existing_lang_code_returns_valid_language_id(
+    # The domain of supported pairs is finite, so a few examples are enough as
+    # long as the most common language is always covered on every platform
+    @h.example(platform_and_lang_code=(fr_platforms.WINDOWS_PLATFORM, "en"))
+    @h.example(platform_and_lang_code=(fr_platforms.MAC_PLATFORM, "en"))
+    @h.settings(max_examples=20)
+    def test_existing_lang_code_returns_valid_language_id_and_info(
         self,
-        platform: fr_platforms.LanguageMappedPlatform,
-        lang_code: str,
+        platform_and_lang_code: tuple[fr_platforms.LanguageMappedPlatform, str],
     ) -> None:
-        """Test if `get_language_id()` with a supported language code returns
-        a valid language ID.
+        """Test if querying a platform with a supported language code returns
+        valid IDs and language info.
+
+        Checks both `get_language_id()` and `get_language_info()` on the same
+        example, since drawing the example is the most expensive part. Language
+        info `li` is considered correct if:
+            - `li.platform_id` matches the `platform`'s own
+              `platform_id`.
+            - `li.language_id` matches the value provided by the
+              `platform`.
+            - `li.platform_encoding_id` matches the value for `language_code`
+              provided by the `platform`.
         """
+        platform, lang_code = platform_and_lang_code
         language_id = platform.get_language_id(lang_code)
         assert isinstance(language_id, int)
         assert platform.language_ids[lang_code] == language_id
 
+        language_info = fr_platforms.get_language_info(platform, lang_code)
+        assert isinstance(language_info, fr_platforms.LanguageInfo)
+        assert language_info.platform_id == platform.platform_id
+        assert language_info.language_id == language_id
+        assert (
+            language_info.platform_encoding_id
+            == platform.get_platform_encoding_id(lang_code)
+        )
+
     @h.given(
-        platform=h_strats.from_type(fr_platforms.LanguageMappedPlatform),
-        lang_code=h_strats.text(),
+        platform=_PLATFORM_STRAT,
+        lang_code=h_strats_custom.unsupported_language_codes,
     )
     def test_get_language_id_missing_lang_code_raises_UnsupportedLanguageCodeError(  # noqa: E501
         self,
@@ -57,30 +89,32 @@ class TestLanguageMappedPlatform:
         """Test if `get_language_id()` with an unsupported language code raises
         an `UnsupportedLanguageCodeError`.
         """
-        # Only use language codes that are not supported by the platform
-        h.assume(lang_code not in platform.language_ids.keys())
-
         with pytest.raises(fr_platforms.UnsupportedLanguageCodeError):
             platform.get_language_id(lang_code)
 
-    @h.given(
-        # Since we need to test attributes specific to the instance of a
-        # platform, we have to share it...
-        instance=h_strats.shared(
-            h_strats.sampled_from(
-                sorted(fr_platforms.PLATFORMS, key=lambda x: x.name)
-            ),
-            key="test_attr_assignment",
-        ),
-        # ...and extract a list of attributes on which assignment will be
-        # tested
-        attribute_name=h_strats.shared(
-            h_strats.sampled_from(
-                sorted(fr_platforms.PLATFORMS, key=lambda x: x.name)
-            ),
-            key="test_attr_assignment",
-        ).flatmap(lambda x: h_strats.sampled_from(sorted(vars(x).keys()))),
-    )
+    @pytest.mark.parametrize("platform", h_strats_custom.PLATFORMS_BY_NAME)
+    @utils.parametrize_round_trips
+    def test_constant_platform_round_trip_returns_equal_platform(
+        self,
+        platform: fr_platforms.LanguageMappedPlatform,
+        round_trip: typ.Callable[
+            [fr_platforms.LanguageMappedPlatform],
+            fr_platforms.LanguageMappedPlatform,
+        ],
+    ) -> None:
+        """Test if copying or pickling a platform defined as a constant returns
+        an equal, hashable platform with the same language info.
+        """
+        copied = round_trip(platform)
+        assert copied == platform
+        assert hash(copied) == hash(platform)
+        assert copied.get_language_info("en") == platform.get_language_info(
+            "en"
+        )
+
+    # Every supported platform and attribute is a small finite set, so check
+    # them all instead of generating examples
+    @pytest.mark.parametrize("instance,attribute_name", _PLATFORM_ATTR_PAIRS)
     def test_constant_platform_attribute_assignment_raises_FrozenInstanceError(
         self,
         instance: fr_platforms.LanguageMappedPlatform,
@@ -97,51 +131,49 @@ class TestLanguageMappedPlatform:
             setattr(instance, attribute_name, None)
 
 
+# A platform that maps a language code to a language ID, but has no platform
+# encoding ID for this language ID
+_PLATFORM_WITHOUT_ENCODING = fr_platforms.LanguageMappedPlatform(
+    name="test",
+    platform_id=fr_const.PlatformID.WINDOWS,
+    valid_platform_encoding_ids=frozenset(),
+    valid_language_ids=frozenset({1}),
+    language_ids={"xx": 1},
+    platform_encoding_ids={},
+)
+
+
 class TestGetLanguageInfo:
     """Test suite for the `get_language_info` function."""
 
-    @h.given(
-        platform=h_strats.shared(
-            h_strats.from_type(fr_platforms.LanguageMappedPlatform),
-            key="test_supported_language_code_returns_correct_language_info",
-        ),
-        language_code=h_strats.shared(
-            h_strats.from_type(fr_platforms.LanguageMappedPlatform),
-            key="test_supported_language_code_returns_correct_language_info",
-        ).flatmap(
-            lambda p: h_strats.sampled_from(sorted(p.language_ids.keys()))
-        ),
+    @pytest.mark.parametrize(
+        "get_language_info",
+        [
+            _PLATFORM_WITHOUT_ENCODING.get_language_info,
+            ft.partial(
+                fr_platforms.get_language_info, _PLATFORM_WITHOUT_ENCODING
+            ),
+        ],
+        ids=["method", "function"],
     )
-    def test_supported_language_code_returns_correct_language_info(
+    def test_missing_platform_encoding_id_raises(
         self,
-        platform: fr_platforms.LanguageMappedPlatform,
-        language_code: str,
+        get_language_info: typ.Callable[[str], fr_platforms.LanguageInfo],
     ) -> None:
-        """Test if calling with a `language_code` supported by `platform`
-        returns correct `LanguageInfo`.
-
-        Language info `li` is considered correct if:
-            - `li.platform_id` matches the `platform`'s own
-              `platform_id`.
-            - `li.language_id` matches the value provided by the
-              `platform`.
-            - `li.platform_encoding_id` matches the value for `language_code`
-              provided by the `platform`.
+        """Test if getting info for a language code that maps to a language ID,
+        but not to a platform encoding ID, raises
+        `UnsupportedLanguageCodeError` about the platform encoding ID.
         """
-        language_info = fr_platforms.get_language_info(platform, language_code)
-        assert isinstance(language_info, fr_platforms.LanguageInfo)
-        assert language_info.platform_id == platform.platform_id
-        assert language_info.language_id == platform.get_language_id(
-            language_code
-        )
-        assert (
-            language_info.platform_encoding_id
-            == platform.get_platform_encoding_id(language_code)
-        )
+        assert _PLATFORM_WITHOUT_ENCODING.get_language_id("xx") == 1
+        with pytest.raises(
+            fr_platforms.UnsupportedLanguageCodeError,
+            match="platform encoding ID",
+        ):
+            get_language_info("xx")
 
     @h.given(
-        platform=h_strats.from_type(fr_platforms.LanguageMappedPlatform),
-        language_code=h_strats.text()
+        platform=_PLATFORM_STRAT,
+        language_code=h_strats_custom.unsupported_language_codes,
     )
     def test_unsupported_language_code_raises(
         self,
@@ -151,7 +183,5 @@ class TestGetLanguageInfo:
         """Test if calling with a `language_code` NOT supported by `platform`
         raises `UnsupportedLanguageCodeError`.
         """
-
-        h.assume(language_code not in platform.language_ids.keys())
         with pytest.raises(fr_platforms.UnsupportedLanguageCodeError):
             fr_platforms.get_language_info(platform, language_code)
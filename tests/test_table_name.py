@@ -0,0 +1,29 @@
+"""Tests for facilities that interact with the OpenType `name` table."""
+import typing as typ
+
+import font_renamer.table_name as fr_table_name
+
+from . import utils
+
+
+_NAME_RECORD = fr_table_name.NameRecord(
+    string="Family",
+    name_id=1,
+    platform_id=3,
+    platform_encoding_id=1,
+    language_id=0x0409,
+)
+
+
+class TestNameRecord:
+    """Test the standard name record implementation."""
+
+    @utils.parametrize_round_trips
+    def test_round_trip_returns_equal_name_record(
+        self,
+        round_trip: typ.Callable[
+            [fr_table_name.NameRecord], fr_table_name.NameRecord
+        ],
+    ) -> None:
+        """Test if copying or pickling a name record returns an equal record."""
+        assert round_trip(_NAME_RECORD) == _NAME_RECORD
@@ -1,5 +1,4 @@
 import collections.abc as col_abc
-import functools as ft
 import typing as typ
 
 import hypothesis as h
@@ -18,10 +17,20 @@ IgnoredIterables = typ.Union[str, bytes]
 RecursivePrimitives = typ.Union[bool, IgnoredIterables]
 IterablePrimitives = typ.Union[RecursivePrimitives, list["IterablePrimitives"]]
 
+# Flatness does not depend on how deeply iterables are nested, so bound the
+# size of drawn iterables to keep examples cheap to generate
 recursive_iterables = h_strats.recursive(
     # Use booleans, binary or text to test excluded iterables
     h_strats.one_of(h_strats.booleans(), h_strats.binary(), h_strats.text()),
-    ft.partial(h_strats.lists),
+    lambda children: h_strats.lists(children, max_size=8),
+    max_leaves=50,
+)
+
+
+# Flattened items are usually exactly of an atomic type, and not of a subclass,
+# so check them by type first
+_ATOMIC_TYPE_SET: typ.FrozenSet[type] = frozenset(
+    utils.FLAT_DEFAULT_ATOMIC_ITERABLES
 )
 
 
@@ -36,18 +45,113 @@ class TestFlatten:
         # An iterable is considered flat if it doesn't have any iterables
         # inside of it, except iterables that have been ignored
         for item in utils.flat(iterables):
+            # Most items are exactly of one of the atomic types, so skip the
+            # generic checks for them
+            if type(item) in _ATOMIC_TYPE_SET:
+                continue
             assert not (
                 isinstance(item, col_abc.Iterable)
-                and not isinstance(
-                    item, tuple(utils.FLAT_DEFAULT_ATOMIC_ITERABLES)
-                )
+                and not isinstance(item, utils.FLAT_DEFAULT_ATOMIC_ITERABLES)
             )
 
+    def test_flat_with_custom_atomic_types_flattens_other_iterables(
+        self,
+    ) -> None:
+        """Test if `flat()` with custom `atomic_types` keeps only instances of
+        these types intact at every nesting level.
+
+        Strings are not atomic here, so they are split into characters, which
+        are yielded as-is, since they iterate to themselves.
+        """
+        iterables = ["ab", [b"cd", ("e", [b"f"])]]
+        flattened = list(utils.flat(iterables, atomic_types=(bytes,)))
+        assert flattened == ["a", "b", b"cd", "e", b"f"]
+
+    def test_flat_on_iterable_that_contains_itself_raises_RecursionError(
+        self,
+    ) -> None:
+        iterables: list = []
+        iterables.append(iterables)
+        with pytest.raises(RecursionError):
+            list(utils.flat(iterables))
+
 
+# Tests make literals of the same shared values over and over, so reuse them
+@utils.memoize(maxsize=1024)
 def _make_literal(x):
     return typ.Literal[x]
 
 
+# Strategies below are shared by most tests of `TestIsinstance`, so build them
+# once instead of rebuilding identical strategies for every test
+_literal_supported_values = h_strats.one_of(
+    h_strats.none(),
+    h_strats.booleans(),
+    h_strats.integers(),
+    h_strats.text(),
+    h_strats.lists(h_strats.booleans() | h_strats.integers() | h_strats.text()),
+)
+
+_literals = _literal_supported_values.map(_make_literal)
+
+
+def _same_type_but_not(x: T) -> h_strats.SearchStrategy[T]:
+    return h_strats_custom.same_type_but_not([x])
+
+
+def _paired(
+    key: str,
+    make_other: typ.Callable[[typ.Any], h_strats.SearchStrategy] = (
+        _same_type_but_not
+    ),
+) -> tuple[h_strats.SearchStrategy, h_strats.SearchStrategy]:
+    """Return a strategy for supported literal values shared by `key`, and a
+    strategy for other values made from the shared value by `make_other`.
+
+    By default, other values are of the same type as the shared value, but do
+    not equal it.
+    """
+    shared_values = h_strats.shared(_literal_supported_values, key=key)
+    return shared_values, shared_values.flatmap(make_other)
+
+
+# Shared strategies only share values within a single test, so tests can share
+# the pairs, too
+_original_values, _other_values = _paired("original_and_other_value")
+_reference_values, _values_of_any_other_type = _paired(
+    "reference_and_value_of_any_type",
+    make_other=h_strats_custom.everything_except_value,
+)
+
+
+def _types_unrelated_to(
+    reference_type: type,
+) -> h_strats.SearchStrategy[type]:
+    """Return a strategy for types that are neither subclasses nor
+    superclasses of `reference_type`.
+    """
+    return h_strats.from_type(type).filter(
+        lambda x: not (
+            issubclass(x, reference_type) or issubclass(reference_type, x)
+        )
+    )
+
+
+def _objects_of_types_unrelated_to(
+    reference_type: type,
+) -> h_strats.SearchStrategy:
+    """Return a strategy for objects of types unrelated to `reference_type`.
+
+    Strategies for abstract types draw instances of concrete subclasses, which
+    can also be subclasses of `reference_type`, so filter them out, too.
+    """
+    return (
+        _types_unrelated_to(reference_type)
+        .flatmap(h_strats.from_type)
+        .filter(lambda x: not issubclass(type(x), reference_type))
+    )
+
+
 class TestIsinstance:
     """Test utilities for patched `isinstance`.
 
@@ -58,20 +162,6 @@ class TestIsinstance:
     LiteralSupportedTypes = typ.Union[
         None, bool, int, str, list[typ.Union[None, bool, int, str]]
     ]
-    _literal_supported_values = h_strats.one_of(
-        h_strats.none(),
-        h_strats.booleans(),
-        h_strats.integers(),
-        h_strats.text(),
-        h_strats.lists(
-            h_strats.booleans() | h_strats.integers() | h_strats.text()
-        ),
-    )
-
-    # Since static methods cannot be used unbound from the class context, yet
-    # `_make_literal` is used often, and is local to the class, bind it to a
-    # lambda
-    _literals = _literal_supported_values.map(_make_literal)
 
     @h.given(obj=_literals)
     def test_is_typing_literal_on_literal_returns_true(
@@ -82,11 +172,10 @@ class TestIsinstance:
         """
         assert utils.is_typing_literal(obj)
 
-    @h.given(
-        # Literals are not subclasses of `type`, so this strategy will not
-        # generate `Literal`s.
-        obj=h_strats.from_type(object)
-    )
+    # Plain values are never literals. Drawing arbitrary objects via
+    # `from_type(object)` makes Hypothesis walk its whole type registry.
+    @h.given(obj=h_strats_custom.plain_values)
+    @h.settings(max_examples=25)
     def test_is_typing_literal_on_everything_except_literal_returns_false(
         self, obj: object
     ) -> None:
@@ -96,10 +185,7 @@ class TestIsinstance:
         assert not utils.is_typing_literal(obj)
 
     @h.given(
-        value=h_strats.shared(
-            _literal_supported_values,
-            key="test_get_literal_value_equals_original_value",
-        ),
+        value=_literal_supported_values,
     )
     def test_get_literal_value_with_original_value_equal(
         self,
@@ -112,14 +198,8 @@ class TestIsinstance:
         assert utils.get_literal_value(literal) == value
 
     @h.given(
-        value=h_strats.shared(
-            _literal_supported_values,
-            key="test_get_literal_value_does_not_equal_values_except_original",
-        ),
-        other_value=h_strats.shared(
-            _literal_supported_values,
-            key="test_get_literal_value_does_not_equal_values_except_original",
-        ).flatmap(lambda x: h_strats_custom.same_type_but_not([x])),
+        value=_original_values,
+        other_value=_other_values,
     )
     def test_get_literal_value_with_values_other_than_original_not_equal(
         self, value: LiteralSupportedTypes, other_value: LiteralSupportedTypes
@@ -127,7 +207,8 @@ class TestIsinstance:
         literal = _make_literal(value)
         assert utils.get_literal_value(literal) != other_value
 
-    @h.given(obj=h_strats.from_type(object))
+    @h.given(obj=h_strats_custom.plain_values)
+    @h.settings(max_examples=25)
     def test_get_literal_value_on_non_literals_raises_value_error(
         self, obj: object
     ) -> None:
@@ -162,14 +243,8 @@ class TestIsinstance:
         assert not utils.is_value_of_literal(other_literal, literal)
 
     @h.given(
-        val=h_strats.shared(
-            _literal_supported_values,
-            key="test_get_literal_value_does_not_equal_values_except_original",
-        ),
-        other_val=h_strats.shared(
-            _literal_supported_values,
-            key="test_get_literal_value_does_not_equal_values_except_original",
-        ).flatmap(lambda x: h_strats_custom.same_type_but_not([x])),
+        val=_original_values,
+        other_val=_other_values,
     )
     def test_is_value_of_literal_does_not_equal_values_except_original(
         self, val: LiteralSupportedTypes, other_val: LiteralSupportedTypes
@@ -188,20 +263,8 @@ class TestIsinstance:
         assert utils.is_literal(literal1, literal2) is True
 
     @h.given(
-        reference_value=h_strats.shared(
-            _literal_supported_values,
-            key=(
-                "test_is_literal_on_literals_with_mismatching_value_returns_"
-                "false"
-            ),
-        ),
-        mismatching_value=h_strats.shared(
-            _literal_supported_values,
-            key=(
-                "test_is_literal_on_literals_with_mismatching_value_returns_"
-                "false"
-            ),
-        ).flatmap(lambda x: h_strats_custom.same_type_but_not([x])),
+        reference_value=_original_values,
+        mismatching_value=_other_values,
     )
     def test_is_literal_on_literals_with_mismatching_value_returns_false(
         self,
@@ -214,7 +277,7 @@ class TestIsinstance:
         literal2 = _make_literal(mismatching_value)
         assert utils.is_literal(literal1, literal2) is False
 
-    @h.given(literal=_literals, nonliteral=h_strats.from_type(object))
+    @h.given(literal=_literals, nonliteral=h_strats_custom.plain_values)
     def test_is_literal_on_literal_and_nonliteral_returns_false(
         self, literal: test_types.Literal, nonliteral: object
     ) -> None:
@@ -230,14 +293,8 @@ class TestIsinstance:
         assert utils.isinstance_literal(original_value, literal) is True
 
     @h.given(
-        original_value=h_strats.shared(
-            _literal_supported_values,
-            key="test_isinstance_literal_on_mismatching_values_returns_false",
-        ),
-        mismatching_value=h_strats.shared(
-            _literal_supported_values,
-            key="test_isinstance_literal_on_mismatching_values_returns_false",
-        ).flatmap(lambda x: h_strats_custom.same_type_but_not([x])),
+        original_value=_original_values,
+        mismatching_value=_other_values,
     )
     def test_isinstance_literal_on_literal_and_mismatching_value_returns_false(
         self,
@@ -251,14 +308,8 @@ class TestIsinstance:
         assert utils.isinstance_literal(mismatching_value, literal) is False
 
     @h.given(
-        original_value=h_strats.shared(
-            _literal_supported_values,
-            key="test_isinstance_literal_on_mismatching_values_returns_false",
-        ),
-        mismatching_value=h_strats.shared(
-            _literal_supported_values,
-            key="test_isinstance_literal_on_mismatching_values_returns_false",
-        ).flatmap(lambda x: h_strats_custom.same_type_but_not([x])),
+        original_value=_original_values,
+        mismatching_value=_other_values,
     )
     def test_isinstance_literal_on_literals_with_mismatching_values_returns_false(  # noqa: line-too-long
         self,
@@ -273,20 +324,8 @@ class TestIsinstance:
         assert utils.isinstance_literal(literal2, literal1) is False
 
     @h.given(
-        value=h_strats.shared(
-            _literal_supported_values,
-            key=(
-                "test_isinstance_literal_on_literal_and_nonliteral_returns_"
-                "false"
-            ),
-        ),
-        nonliteral=h_strats.shared(
-            _literal_supported_values,
-            key=(
-                "test_isinstance_literal_on_literal_and_nonliteral_returns_"
-                "false"
-            ),
-        ).flatmap(h_strats_custom.everything_except_value),
+        value=_reference_values,
+        nonliteral=_values_of_any_other_type,
     )
     def test_isinstance_literal_on_literal_and_nonliteral_returns_false(
         self,
@@ -323,20 +362,8 @@ class TestIsinstance:
         assert utils.isinstance_(literal1, literal2) is True
 
     @h.given(
-        value=h_strats.shared(
-            _literal_supported_values,
-            key=(
-                "test_isinstance__on_value_and_literal_with_other_value_"
-                "returns_false"
-            ),
-        ),
-        other_value=h_strats.shared(
-            _literal_supported_values,
-            key=(
-                "test_isinstance__on_value_and_literal_with_other_value_"
-                "returns_false"
-            ),
-        ).flatmap(lambda x: h_strats_custom.same_type_but_not([x])),
+        value=_original_values,
+        other_value=_other_values,
     )
     def test_isinstance__on_value_and_literal_with_other_value_returns_false(
         self,
@@ -348,20 +375,8 @@ class TestIsinstance:
         assert utils.isinstance_(value, literal) is False
 
     @h.given(
-        value=h_strats.shared(
-            _literal_supported_values,
-            key=(
-                "test_isinstance__on_literals_with_mismatching_values_"
-                "returns_false"
-            ),
-        ),
-        other_value=h_strats.shared(
-            _literal_supported_values,
-            key=(
-                "test_isinstance__on_literals_with_mismatching_values_"
-                "returns_false"
-            ),
-        ).flatmap(lambda x: h_strats_custom.same_type_but_not([x])),
+        value=_original_values,
+        other_value=_other_values,
     )
     def test_isinstance__on_literals_with_mismatching_values_returns_false(
         self,
@@ -376,18 +391,8 @@ class TestIsinstance:
         assert utils.isinstance_(literal1, literal2) is False
 
     @h.given(
-        reference_value=h_strats.shared(
-            _literal_supported_values,
-            key=(
-                "test_isinstance__on_everything_except_reference_returns_false"
-            ),
-        ),
-        other_value=h_strats.shared(
-            _literal_supported_values,
-            key=(
-                "test_isinstance__on_everything_except_reference_returns_false"
-            ),
-        ).flatmap(h_strats_custom.everything_except_value),
+        reference_value=_reference_values,
+        other_value=_values_of_any_other_type,
     )
     def test_isinstance__on_everything_except_reference_returns_false(
         self,
@@ -418,6 +423,9 @@ class TestIsinstance:
             ),
         ).flatmap(h_strats.from_type),
     )
+    # Drawing types and their instances walks the Hypothesis type registry, so
+    # bound the number of examples
+    @h.settings(max_examples=25)
     def test_isinstance__on_nonliteral_type_and_matching_object_returns_true(
         self,
         obj_type: type[T],
@@ -442,11 +450,11 @@ class TestIsinstance:
                 "mismatching_type_returns_false"
             ),
         )
-        # Generate type `S` that is not the shared type `T`
-        .flatmap(lambda x: h_strats.from_type(type).filter(lambda y: x != y))
-        # Create an object from type `S`
-        .flatmap(h_strats.from_type),
+        # Create an object of type `S`, which is neither a subclass nor a
+        # superclass of the shared type `T`
+        .flatmap(_objects_of_types_unrelated_to),
     )
+    @h.settings(max_examples=25)
     def test_isinstance__on_nonliteral_type_and_object_of_mismatching_type_returns_false(  # noqa: line-too-long
         self,
         obj_type: type,
@@ -3,13 +3,76 @@
 Used either in writing tests or defining Hypothesis strategies.
 """
 import collections.abc as col_abc
+import copy
 import enum
+import functools as ft
+import pickle
+import sys
+import types
 import typing as typ
 
+import pytest
+
 from . import types as test_types
 
 
-FLAT_DEFAULT_ATOMIC_ITERABLES: typ.List[type] = [str, bytes, enum.EnumMeta]
+T = typ.TypeVar("T")
+R = typ.TypeVar("R")
+
+
+FLAT_DEFAULT_ATOMIC_ITERABLES: typ.Tuple[type, ...] = (
+    str,
+    bytes,
+    enum.EnumMeta,
+)
+
+# `typing.Literal` is a singleton, so origins of literals can be compared to it
+# by identity. Bind both to module globals to skip attribute lookups on
+# `typing` on every check.
+_GET_ORIGIN = typ.get_origin
+_LITERAL = typ.Literal
+
+
+def memoize(
+    maxsize: typ.Optional[int],
+) -> typ.Callable[[typ.Callable[[T], R]], typ.Callable[[T], R]]:
+    """Return a decorator that caches results of a single-argument function.
+
+    Hypothesis calls some pure functions on thousands of examples, often with
+    the same arguments. However, some of their arguments, such as lists, cannot
+    be hashed. Such arguments bypass the cache.
+    """
+
+    def _decorator(func: typ.Callable[[T], R]) -> typ.Callable[[T], R]:
+        # Cache by type, too, so that, for example, `1` and `True` do not
+        # share results
+        cached_func = ft.lru_cache(maxsize=maxsize, typed=True)(func)
+
+        @ft.wraps(func)
+        def _memoized(arg: T) -> R:
+            try:
+                hash(arg)
+            except TypeError:
+                return func(arg)
+            return cached_func(arg)
+
+        return _memoized
+
+    return _decorator
+
+
+def pickle_round_trip(obj: T) -> T:
+    """Return a copy of `obj` made by pickling and unpickling it."""
+    return pickle.loads(pickle.dumps(obj))
+
+
+# Parametrizes a test with every way to copy an object in a `round_trip`
+# argument
+parametrize_round_trips = pytest.mark.parametrize(
+    "round_trip",
+    [copy.copy, copy.deepcopy, pickle_round_trip],
+    ids=["copy", "deepcopy", "pickle"],
+)
 
 
 def flat(
@@ -24,23 +87,45 @@ def flat(
     Raises:
         RecursionError: if `iterables` are too nested.
     """
+    # The default is already a tuple, so it can be passed to `isinstance()` as
+    # is
     atomic_types = (
-        atomic_types
-        if atomic_types is not None
-        else FLAT_DEFAULT_ATOMIC_ITERABLES
+        FLAT_DEFAULT_ATOMIC_ITERABLES
+        if atomic_types is None
+        else tuple(atomic_types)
     )
-    for item in inputs:
-        if isinstance(item, col_abc.Iterable) and not isinstance(
-            item, tuple(atomic_types)
-        ):
-            yield from flat(*item)
-        else:
+    # Walk nested iterables with an explicit stack of iterators instead of
+    # recursion. This avoids a generator frame per nesting level and is not
+    # limited by the recursion depth. Still, bound the nesting by the recursion
+    # limit, so that iterables that contain themselves fail instead of growing
+    # the stack forever.
+    max_depth = sys.getrecursionlimit()
+    stack = [iter(inputs)]
+    while stack:
+        for item in stack[-1]:
+            if (
+                isinstance(item, col_abc.Iterable)
+                and not isinstance(item, atomic_types)
+                # A one-character string iterates to itself, so it cannot be
+                # flattened any further, even if `str` is not atomic
+                and not (isinstance(item, str) and len(item) == 1)
+            ):
+                if len(stack) >= max_depth:
+                    raise RecursionError(
+                        f"Iterables are nested deeper than {max_depth} levels."
+                    )
+                # Descend into the nested iterable, and resume the current one
+                # once the nested one is exhausted
+                stack.append(iter(item))
+                break
             yield item
+        else:
+            stack.pop()
 
 
 def is_typing_literal(obj: typ.Any) -> bool:
     """Return `True` if `obj` is a `typing.Literal`, otherwise False."""
-    return typ.get_origin(obj) == typ.Literal
+    return _GET_ORIGIN(obj) is _LITERAL
 
 
 def get_literal_value(literal: test_types.Literal) -> test_types.LiteralValue:
@@ -63,7 +148,7 @@ def get_literal_value(literal: test_types.Literal) -> test_types.LiteralValue:
 def is_value_of_literal(obj: object, literal: test_types.Literal) -> bool:
     """Return `True` if `obj` is a value of `literal`, `False` otherwise."""
     literal_value = get_literal_value(literal)
-    return type(obj) == type(literal_value) and obj == literal_value
+    return type(obj) is type(literal_value) and obj == literal_value
 
 
 def is_literal(obj: object, literal: test_types.Literal) -> bool:
@@ -75,12 +160,11 @@ def is_literal(obj: object, literal: test_types.Literal) -> bool:
     if not is_typing_literal(literal):
         raise ValueError(f"Argument {literal} is not a Literal.")
 
-    return is_typing_literal(obj) and get_literal_value(
-        # After the first conditional `obj` is established to be a
-        # `typing.Literal`, and is suitable to be an argument of
-        # `get_literal_value()`
-        typ.cast(test_types.Literal, obj)
-    ) == get_literal_value(literal)
+    # Compare arguments of both literals directly instead of unwrapping their
+    # values
+    return is_typing_literal(obj) and typ.get_args(obj) == typ.get_args(
+        literal
+    )
 
 
 def isinstance_literal(obj: object, literal: test_types.Literal) -> bool:
@@ -95,6 +179,34 @@ def isinstance_literal(obj: object, literal: test_types.Literal) -> bool:
     return is_value_of_literal(obj, literal) or is_literal(obj, literal)
 
 
+def _isinstance_maybe_literal(obj: object, type_spec: typ.Any) -> bool:
+    """Check if `obj` is an instance of `type_spec`, which might be a
+    `typing.Literal`.
+    """
+    if isinstance(type_spec, (type, tuple)):
+        # Classes with custom metaclasses, such as enums, are not dispatched by
+        # their exact type, but are never literals either
+        return isinstance(obj, type_spec)
+    elif is_typing_literal(type_spec):
+        # Since the built-in `isinstance` does not support checking `obj`
+        # against a `typing.Literal`, dispatch a special function to handle
+        # them.
+        # TODO: since `type_spec` can be recursive, and one of the leaves can
+        # contain a literal, check for literals recursively
+        return isinstance_literal(obj, type_spec)
+    else:
+        # Fall back on the built-in in all other cases
+        return isinstance(obj, type_spec)
+
+
+# Handlers of `isinstance_()` by the type of `type_spec`. Plain types and tuples
+# of them are checked most often, and are never literals, so hand them to the
+# built-in without looking for literals.
+_ISINSTANCE_DISPATCH: typ.Mapping[
+    type, typ.Callable[[object, typ.Any], bool]
+] = types.MappingProxyType({type: isinstance, tuple: isinstance})
+
+
 def isinstance_(
     obj: object,
     type_spec: typ.Union[
@@ -107,22 +219,13 @@ def isinstance_(
 
     Argument `type` can be a `typing.Literal`.
     """
-    if is_typing_literal(type_spec):
-        # Since the built-in `isinstance` does not support checking `obj`
-        # against a `typing.Literal`, dispatch a special function to handle
-        # them.
-        # TODO: since `type_spec` can be recursive, and one of the leaves can
-        # contain a literal, check for literals recursively
-        return isinstance_literal(
-            obj,
-            # if condition ensures `type` is a literal
-            typ.cast(test_types.Literal, type_spec),
-        )
-    else:
-        # Fall back on the built-in in all other cases
-        return isinstance(obj, type_spec)
+    return _ISINSTANCE_DISPATCH.get(
+        type(type_spec), _isinstance_maybe_literal
+    )(obj, type_spec)
 
 
+# Type hints are requested for the same few classes over and over
+@ft.lru_cache(maxsize=None)
 def get_type_hints_or_raise(cls: type) -> typ.Mapping[str, type]:
     """Return type hints for `cls` or raise `ValueError`."""
     hints = typ.get_type_hints(cls)